@@ -11,15 +11,99 @@ UniformTypeDataObject
     This subclass does not validate types, but acts as a generic container that
     allows static type checkers to recognize all the attributes as being of a
     specifi, uniform type.
+SlottedDataObject
+    A sibling of DataObject with a fixed set of attributes stored in
+    `__slots__` rather than in an instance `__dict__`. Uses less memory per
+    instance and has faster attribute access, at the cost of not allowing
+    arbitrary new attributes. Use `DataObject.with_fields` to create concrete
+    subclasses with a given set of field names.
+
+Notes
+-----
+This module is deliberately kept pure Python with complete type annotations,
+so that downstream projects which are bottlenecked on these container classes
+can compile it themselves with mypyc or Cython without changes. The package
+itself ships pure Python only (the build backend does not build extension
+modules), so any such compilation has to happen on the consuming side. If you
+do compile it, benchmark both the dict-backed and the slotted classes for
+your workload: attribute access on compiled native classes can be slower than
+plain Python for dynamic schemas like DataObject's.
 """
 from collections.abc import (
+    ItemsView,
     Iterator,
+    KeysView,
+    Mapping,
     MutableMapping,
+    ValuesView,
 )
+import inspect
 import typing as tp
+import weakref
+
+
+_NO_DEFAULT: tp.Any = object()
+"""Sentinel for distinguishing an omitted `default` argument from None."""
+
+_reserved_names_cache: dict[type, frozenset[str]] = {}
+"""Per-class cache for `_reserved_attribute_names`."""
+
+
+def _reserved_attribute_names(cls: type) -> frozenset[str]:
+    """Return the attribute names of `cls` that are data descriptors.
+
+    Names like `'__dict__'` and `'__class__'` are data descriptors on the
+    type, so attribute access never consults the instance dict for them.
+    Storing such a name in the instance dict directly would therefore create
+    an entry that item access returns but attribute access never sees,
+    silently breaking the item/attribute equivalence of DataObject. The
+    mapping methods that write straight into the instance dict reject them.
+
+    Parameters
+    ----------
+    cls : type
+        The class to collect reserved names for. The result is cached per
+        class.
+
+    Returns
+    -------
+    frozenset[str]
+        The names of all data descriptors found on `cls` and its bases.
+    """
+    try:
+        return _reserved_names_cache[cls]
+    except KeyError:
+        pass
+    reserved: frozenset[str] = frozenset(
+        _name
+        for _klass in cls.__mro__
+        for _name, _value in vars(_klass).items()
+        if inspect.isdatadescriptor(_value)
+    )
+    _reserved_names_cache[cls] = reserved
+    return reserved
+###END def _reserved_attribute_names
 
 
-class DataObject(MutableMapping):
+def _check_no_reserved_keys(
+        cls: type,
+        keys: Mapping[str, tp.Any] | tp.Collection[str],
+) -> None:
+    """Raise a TypeError if any of `keys` is a reserved attribute name of
+    `cls` (see `_reserved_attribute_names`)."""
+    reserved: frozenset[str] = _reserved_attribute_names(cls)
+    if not reserved.isdisjoint(keys):
+        _bad: str = ', '.join(sorted(
+            repr(_key) for _key in reserved.intersection(keys)
+        ))
+        raise TypeError(
+            f'Cannot set reserved attribute name(s) {_bad} on '
+            f'{cls.__name__} instances.'
+        )
+###END def _check_no_reserved_keys
+
+
+class DataObject:
     """A basic object class that can be initialized with any set of attributes
     as keyword arguments, provides a readable string representation, and allows
     setting and getting attributes using dictionary-like syntax.
@@ -45,9 +129,13 @@ class DataObject(MutableMapping):
         ----------
         **kwargs : Any
             Arbitrary keyword arguments to set as attributes of the object.
+            Names that are data descriptors on the class (such as
+            `'__dict__'` or `'__class__'`) are rejected with a TypeError.
         """
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        # Move all the keyword arguments into the instance dict in a single
+        # C-level call rather than one setattr call per attribute.
+        _check_no_reserved_keys(type(self), kwargs)
+        self.__dict__.update(kwargs)
     ###END DataObject.__init__
 
     def __getitem__(self, key: str) -> tp.Any:
@@ -56,11 +144,22 @@ class DataObject(MutableMapping):
         # self.__dict__.__getitem__ rather than getattr(self, ...), so that a
         # KeyError is raised rather than an AttributeError if they key does not
         # exist.
-        return self.__dict__[key]
+        d: dict[str, tp.Any] = self.__dict__
+        return d[key]
     ###END DataObject.__getitem__
 
     def __setitem__(self, key: str, value: tp.Any) -> None:
-        setattr(self, key, value)
+        # Write to the instance dict directly: setattr would only end up
+        # doing the same through object.__setattr__, at the cost of two
+        # extra C-level calls. Names that are data descriptors on the class
+        # (like '__dict__') must be rejected, since attribute access would
+        # never see the instance dict entry.
+        if key in _reserved_attribute_names(type(self)):
+            raise TypeError(
+                f'Cannot set reserved attribute name {key!r} on '
+                f'{type(self).__name__} instances.'
+            )
+        self.__dict__[key] = value
     ###END DataObject.__setitem__
 
     def __delitem__(self, key: str) -> None:
@@ -68,25 +167,153 @@ class DataObject(MutableMapping):
     ###END DataObject.__delitem__
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.__dict__)
+        d: dict[str, tp.Any] = self.__dict__
+        return iter(d)
     ###END DataObject.__iter__
 
     def __len__(self) -> int:
-        return len(self.__dict__)
+        d: dict[str, tp.Any] = self.__dict__
+        return len(d)
     ###END DataObject.__len__
 
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dict__
+    ###END DataObject.__contains__
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DataObject):
+            return self.__dict__ == other.__dict__
+        if isinstance(other, Mapping):
+            return self.__dict__ == dict(other)
+        return NotImplemented
+    ###END DataObject.__eq__
+
+    def keys(self) -> KeysView[str]:
+        """Return a view of the attribute names, like `dict.keys`."""
+        return self.__dict__.keys()
+    ###END DataObject.keys
+
+    def values(self) -> ValuesView[tp.Any]:
+        """Return a view of the attribute values, like `dict.values`."""
+        return self.__dict__.values()
+    ###END DataObject.values
+
+    def items(self) -> ItemsView[str, tp.Any]:
+        """Return a view of the attribute name/value pairs, like
+        `dict.items`."""
+        return self.__dict__.items()
+    ###END DataObject.items
+
+    def get(self, key: str, default: tp.Any = None) -> tp.Any:
+        """Return the value for `key`, or `default` if `key` is not set."""
+        return self.__dict__.get(key, default)
+    ###END DataObject.get
+
+    def pop(self, key: str, default: tp.Any = _NO_DEFAULT) -> tp.Any:
+        """Remove `key` and return its value, like `dict.pop`.
+
+        If `key` is not set, `default` is returned if given, otherwise a
+        KeyError is raised.
+        """
+        if default is _NO_DEFAULT:
+            return self.__dict__.pop(key)
+        return self.__dict__.pop(key, default)
+    ###END DataObject.pop
+
+    def popitem(self) -> tuple[str, tp.Any]:
+        """Remove and return the most recently set attribute as a
+        `(name, value)` pair, like `dict.popitem`."""
+        return self.__dict__.popitem()
+    ###END DataObject.popitem
+
+    def setdefault(self, key: str, default: tp.Any = None) -> tp.Any:
+        """Return the value for `key`, setting it to `default` first if `key`
+        is not already set. Like `dict.setdefault`."""
+        if key in _reserved_attribute_names(type(self)):
+            raise TypeError(
+                f'Cannot set reserved attribute name {key!r} on '
+                f'{type(self).__name__} instances.'
+            )
+        return self.__dict__.setdefault(key, default)
+    ###END DataObject.setdefault
+
+    def update(
+            self,
+            other: Mapping[str, tp.Any] | tp.Iterable[tuple[str, tp.Any]] = (),
+            /,
+            **kwargs: tp.Any,
+    ) -> None:
+        """Set multiple attributes from a mapping, an iterable of key-value
+        pairs, and/or keyword arguments. Like `dict.update`."""
+        if not isinstance(other, Mapping):
+            other = dict(other)
+        _check_no_reserved_keys(type(self), other)
+        if kwargs:
+            _check_no_reserved_keys(type(self), kwargs)
+        self.__dict__.update(other, **kwargs)
+    ###END DataObject.update
+
+    def clear(self) -> None:
+        """Remove all attributes."""
+        self.__dict__.clear()
+    ###END DataObject.clear
+
+    def freeze(self) -> tp.Self:
+        """Make the DataObject immutable and cache its string representations.
+
+        Intended for objects that are treated as records whose attributes do
+        not change after construction, but whose repr is needed often (e.g.
+        in logging-heavy code paths). The repr and str strings are computed
+        once here and returned directly by subsequent `__repr__`/`__str__`
+        calls, and attempts to set or delete attributes afterwards raise a
+        TypeError. Unfrozen objects pay no overhead.
+
+        Freezing is done by swapping the instance's class to a dynamically
+        created subclass that overrides the mutating methods; the object
+        therefore still passes isinstance checks against its original class,
+        but can no longer be pickled by class name. Note also that only the
+        normal mutation APIs are blocked: code that writes to
+        `self.__dict__` directly (e.g. via `to_dict(copy=False)`) can still
+        mutate the object, in which case the cached repr goes stale. Copies
+        made with `copy.copy` or `copy.deepcopy` remain frozen, but have no
+        cache entry of their own and recompute their repr on each call.
+
+        Returns
+        -------
+        Self
+            The object itself, for chaining. Calling freeze on an already
+            frozen object is a no-op.
+        """
+        cls: type[tp.Self] = type(self)
+        frozen_cls: type | None = _frozen_class_cache.get(cls)
+        if frozen_cls is None:
+            frozen_cls = type(cls.__name__, (_FrozenDataObjectMixin, cls), {})
+            _frozen_class_cache[cls] = frozen_cls
+        # Compute the strings before swapping the class, while __repr__ and
+        # __str__ still walk the attributes. The cache entry is keyed on
+        # id(self) and evicted again when the object is garbage-collected.
+        _frozen_reprs[id(self)] = (repr(self), str(self))
+        weakref.finalize(self, _frozen_reprs.pop, id(self), None)
+        self.__class__ = frozen_cls
+        return self
+    ###END DataObject.freeze
+
     def __repr__(self) -> str:
+        # %-formatting dispatches to C-level PyUnicode_Format in one call
+        # per item, with shorter bytecode than the equivalent f-string.
+        d: dict[str, tp.Any] = self.__dict__
         attrs: str = ',\n    '.join(
-            f"{key}={repr(value)}" for key, value in self.__dict__.items()
+            ['%s=%r' % _item for _item in d.items()]
         )
-        return f'{self.__class__.__name__}(\n    {attrs}\n)'
+        return '%s(\n    %s\n)' % (type(self).__name__, attrs)
     ###END DataObject.__repr__
 
     def __str__(self) -> str:
+        d: dict[str, tp.Any] = self.__dict__
         attrs: str = ', '.join(
-            f"{key}={repr(value)}" for key, value in self.__dict__.items()
+            ['%s=%r' % _item for _item in d.items()]
         )
-        return f'{self.__class__.__name__}({attrs})'
+        return '%s(%s)' % (type(self).__name__, attrs)
     ###END DataObject.__str__
 
     def to_dict(
@@ -110,10 +337,11 @@ class DataObject(MutableMapping):
         dict[str, Any]
             A dictionary representation of the DataObject's attributes.
         """
+        d: dict[str, tp.Any] = self.__dict__
         if copy:
-            return self.__dict__.copy()
+            return dict.copy(d)
         else:
-            return self.__dict__
+            return d
     ###END DataObject.to_dict
 
     def to_tuples(self) -> list[tuple[str, tp.Any]]:
@@ -128,8 +356,209 @@ class DataObject(MutableMapping):
         return list(self.__dict__.items())
     ###END DataObject.to_tuples
 
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, tp.Any]) -> tp.Self:
+        """Create a DataObject directly from a mapping.
+
+        Faster than `cls(**mapping)` for bulk construction: it skips the
+        keyword-argument expansion and moves the items into the new
+        instance's attribute dict in a single `dict.update` call. Note that
+        `__init__` is bypassed entirely.
+
+        Parameters
+        ----------
+        mapping : Mapping[str, Any]
+            Mapping of attribute names to values. Names that are data
+            descriptors on the class (such as `'__dict__'` or `'__class__'`)
+            are rejected with a TypeError.
+
+        Returns
+        -------
+        Self
+            A new instance with the mapping's items as attributes.
+        """
+        _check_no_reserved_keys(cls, mapping)
+        obj: tp.Self = cls.__new__(cls)
+        obj.__dict__.update(mapping)
+        return obj
+    ###END DataObject.from_mapping
+
+    @classmethod
+    def from_records(
+            cls,
+            records: tp.Iterable[Mapping[str, tp.Any]],
+    ) -> list[tp.Self]:
+        """Create a list of DataObjects from an iterable of mappings.
+
+        Intended for batch construction of many objects, e.g. from rows read
+        from a file or database. Each record is converted with
+        `cls.from_mapping`, so `__init__` is bypassed (see the note there).
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+            An iterable of mappings of attribute names to values, one per
+            object to create.
+
+        Returns
+        -------
+        list[Self]
+            A list with one new instance per record.
+        """
+        from_mapping = cls.from_mapping
+        return [from_mapping(record) for record in records]
+    ###END DataObject.from_records
+
+    @classmethod
+    def with_fields(
+            cls,
+            *field_names: str,
+            class_name: str = 'SlottedDataObject',
+    ) -> type['SlottedDataObject']:
+        """Create a SlottedDataObject subclass with a fixed set of fields.
+
+        The returned class stores its attributes in `__slots__` rather than in
+        an instance `__dict__`, which uses significantly less memory per
+        instance and gives faster attribute access. Use it instead of
+        DataObject itself when constructing many instances with the same,
+        known-in-advance set of attributes. See the `SlottedDataObject`
+        docstring for caveats.
+
+        Parameters
+        ----------
+        *field_names : str
+            Names of the fields that instances of the returned class can hold.
+            Each name must be a valid Python identifier, and must not collide
+            with an existing attribute of SlottedDataObject (such as the
+            mapping methods `items`, `keys`, `get` or `to_dict`): the slot
+            descriptor would shadow the method and break the mapping
+            interface of every instance.
+        class_name : str, optional
+            Name to give the returned class (i.e., its `__name__` attribute).
+            Default is `'SlottedDataObject'`.
+
+        Raises
+        ------
+        ValueError
+            If a field name collides with an existing attribute of
+            SlottedDataObject.
+
+        Returns
+        -------
+        type[SlottedDataObject]
+            A dynamically created subclass of SlottedDataObject with
+            `__slots__` equal to `field_names`.
+        """
+        for _name in field_names:
+            if hasattr(SlottedDataObject, _name):
+                raise ValueError(
+                    f'Field name {_name!r} would shadow an existing '
+                    'attribute of SlottedDataObject and cannot be used.'
+                )
+        return type(class_name, (SlottedDataObject,), {
+            '__slots__': tuple(field_names),
+        })
+    ###END DataObject.with_fields
+
 ###END class DataObject
 
+# DataObject no longer inherits from MutableMapping: the generic mixin methods
+# (`keys`, `get`, `__contains__`, etc.) all dispatch through the abstract
+# `__getitem__`/`__iter__`/`__len__` at Python level, whereas the direct
+# implementations above forward straight to the backing dict. Register it as a
+# virtual subclass so isinstance/issubclass checks against the ABCs still
+# pass.
+MutableMapping.register(DataObject)
+
+
+_frozen_reprs: dict[int, tuple[str, str]] = {}
+"""Cached `(repr, str)` strings for frozen DataObjects, keyed on the id of
+the instance. Entries are added by `DataObject.freeze` and removed by a
+weakref finalizer when the instance is garbage-collected. Kept outside the
+instances themselves so that the cache does not show up as an attribute in
+the mapping interface.
+"""
+
+_frozen_class_cache: dict[type, type] = {}
+"""Cache of dynamically created frozen companion classes, keyed on the
+original (unfrozen) class. Ensures that all frozen instances of a given
+DataObject subclass share a single companion class.
+"""
+
+
+class _FrozenDataObjectMixin:
+    """Mixin mixed into the dynamically created companion classes that
+    `DataObject.freeze` swaps frozen instances over to. Returns the cached
+    string representations and blocks all mutating methods.
+    """
+
+    def freeze(self) -> tp.Self:
+        # Already frozen; freezing again is a no-op.
+        return self
+    ###END _FrozenDataObjectMixin.freeze
+
+    def __repr__(self) -> str:
+        # A frozen instance normally has a cache entry, but copies made with
+        # copy.copy/copy.deepcopy share the frozen class without one. Fall
+        # back to recomputing through the unfrozen base class in that case;
+        # __repr__ must never raise.
+        _cached: tuple[str, str] | None = _frozen_reprs.get(id(self))
+        if _cached is not None:
+            return _cached[0]
+        return super().__repr__()
+    ###END _FrozenDataObjectMixin.__repr__
+
+    def __str__(self) -> str:
+        _cached: tuple[str, str] | None = _frozen_reprs.get(id(self))
+        if _cached is not None:
+            return _cached[1]
+        return super().__str__()
+    ###END _FrozenDataObjectMixin.__str__
+
+    def _frozen_error(self) -> TypeError:
+        return TypeError(
+            f'{type(self).__name__} instance is frozen and cannot be modified'
+        )
+    ###END _FrozenDataObjectMixin._frozen_error
+
+    def __setattr__(self, key: str, value: tp.Any) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.__setattr__
+
+    def __delattr__(self, key: str) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.__delattr__
+
+    def __setitem__(self, key: str, value: tp.Any) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.__setitem__
+
+    def __delitem__(self, key: str) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.__delitem__
+
+    def pop(self, key: str, default: tp.Any = _NO_DEFAULT) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.pop
+
+    def popitem(self) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.popitem
+
+    def setdefault(self, key: str, default: tp.Any = None) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.setdefault
+
+    def update(self, *args: tp.Any, **kwargs: tp.Any) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.update
+
+    def clear(self) -> tp.NoReturn:
+        raise self._frozen_error()
+    ###END _FrozenDataObjectMixin.clear
+
+###END class _FrozenDataObjectMixin
+
 
 class UniformTypeDataObject[_T](DataObject):
     """A generic subclass of DataObject with uniformly typed attributes.
@@ -150,11 +579,17 @@ class UniformTypeDataObject[_T](DataObject):
     ###END UniformTypeDataObject.__init__
 
     def __setitem__(self, key: str, value: _T) -> None:
-        setattr(self, key, value)
+        if key in _reserved_attribute_names(type(self)):
+            raise TypeError(
+                f'Cannot set reserved attribute name {key!r} on '
+                f'{type(self).__name__} instances.'
+            )
+        self.__dict__[key] = value
     ###END UniformTypeDataObject.__setitem__
 
     def __getitem__(self, key: str) -> _T:
-        return self.__dict__[key]
+        d: dict[str, _T] = self.__dict__
+        return d[key]
     ###END UniformTypeDataObject.__getitem__
 
     def to_dict(
@@ -171,3 +606,150 @@ class UniformTypeDataObject[_T](DataObject):
     to_tuples.__doc__ = DataObject.to_tuples.__doc__
 
 ###END class UniformTypeDataObject
+
+
+class SlottedDataObject(MutableMapping):
+    """A DataObject variant with a fixed set of attributes stored in __slots__.
+
+    Unlike DataObject, instances do not have a `__dict__`, so the set of
+    allowed attributes is fixed when the class is created. This cuts per-
+    instance memory substantially (the instance dict alone is typically on the
+    order of a hundred bytes or more) and speeds up attribute access, which
+    matters when constructing many small objects such as records or rows.
+
+    This class itself has empty `__slots__` and is not meant to be
+    instantiated directly. Create concrete subclasses either with
+    `DataObject.with_fields(...)` or by subclassing and declaring `__slots__`
+    (every subclass in the chain must declare `__slots__`, or instances will
+    get a `__dict__` after all and the memory savings are lost).
+
+    Known caveats compared to DataObject: attributes not named in `__slots__`
+    cannot be set, and instances do not support weak references unless a
+    subclass adds `'__weakref__'` to its `__slots__`.
+
+    Examples
+    --------
+    >>> Point = DataObject.with_fields('x', 'y', class_name='Point')
+    >>> p = Point(x=1, y=2)
+    >>> print(p)
+    Point(x=1, y=2)
+    >>> p['x']
+    1
+    >>> p.z = 3
+    Traceback (most recent call last):
+        ...
+    AttributeError: 'Point' object has no attribute 'z' and no __dict__ for setting new attributes
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs: tp.Any) -> None:
+        """
+        Parameters
+        ----------
+        **kwargs : Any
+            Values to set for the fields named in the class's `__slots__`.
+            Fields may also be left unset and assigned later. Passing a name
+            that is not in `__slots__` raises an AttributeError.
+        """
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+    ###END SlottedDataObject.__init__
+
+    @classmethod
+    def _field_names(cls) -> tuple[str, ...]:
+        """Return the names of all fields declared in the class's `__slots__`,
+        including slots declared by base classes.
+        """
+        names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            for name in getattr(klass, '__slots__', ()):
+                if name not in names:
+                    names.append(name)
+        return tuple(names)
+    ###END SlottedDataObject._field_names
+
+    def __getitem__(self, key: str) -> tp.Any:
+        # Raise a KeyError rather than an AttributeError when accessed with
+        # dictionary-like syntax, for consistency with DataObject.
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    ###END SlottedDataObject.__getitem__
+
+    def __setitem__(self, key: str, value: tp.Any) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+    ###END SlottedDataObject.__setitem__
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    ###END SlottedDataObject.__delitem__
+
+    def __iter__(self) -> Iterator[str]:
+        # Only yield fields that have actually been set, so that iteration,
+        # len and the mapping views behave like DataObject for partially
+        # initialized instances.
+        for name in self._field_names():
+            if hasattr(self, name):
+                yield name
+    ###END SlottedDataObject.__iter__
+
+    def __len__(self) -> int:
+        return sum(1 for name in self._field_names() if hasattr(self, name))
+    ###END SlottedDataObject.__len__
+
+    def __repr__(self) -> str:
+        attrs: str = ',\n    '.join(
+            ['%s=%r' % _item for _item in self.items()]
+        )
+        return '%s(\n    %s\n)' % (type(self).__name__, attrs)
+    ###END SlottedDataObject.__repr__
+
+    def __str__(self) -> str:
+        attrs: str = ', '.join(
+            ['%s=%r' % _item for _item in self.items()]
+        )
+        return '%s(%s)' % (type(self).__name__, attrs)
+    ###END SlottedDataObject.__str__
+
+    def to_dict(
+            self,
+            copy: bool = True,
+    ) -> dict[str, tp.Any]:
+        """Convert the SlottedDataObject to a dictionary.
+
+        Parameters
+        ----------
+        copy : bool, optional
+            Accepted for compatibility with `DataObject.to_dict`, but ignored.
+            Since there is no backing dictionary, a new dictionary is always
+            built and returned. Default is True.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary of the fields that have been set and their values.
+        """
+        return {key: getattr(self, key) for key in self}
+    ###END SlottedDataObject.to_dict
+
+    def to_tuples(self) -> list[tuple[str, tp.Any]]:
+        """Convert the SlottedDataObject's fields to key-value tuples.
+
+        Returns
+        -------
+        list[tuple[str, Any]]
+            A list of tuples with the name and value of each field that has
+            been set.
+        """
+        return [(key, getattr(self, key)) for key in self]
+    ###END SlottedDataObject.to_tuples
+
+###END class SlottedDataObject
@@ -7,8 +7,6 @@ get_registered_progress_bars:
 set_global_progress_bar:
     Sets or replaces a global Dask progress bar.
 """
-from collections.abc import Callable
-import dataclasses
 from io import TextIOBase
 import typing as tp
 
@@ -16,28 +14,50 @@ from dask.diagnostics.progress import ProgressBar
 
 
 
-@tp.runtime_checkable
-class BoundMethod(tp.Protocol):
-    """Protocol for bound methods."""
-    __self__: tp.Any
-###END class BoundMethod
+_registered_pbs_cache: tuple[
+    frozenset[tuple], frozenset[ProgressBar]
+] | None = None
+"""Cache for `get_registered_progress_bars`, as a tuple of a snapshot of
+`ProgressBar.active` and the progress bars found in it. Rebuilt whenever the
+snapshot no longer matches. The snapshot holds strong references to the
+callback tuples themselves and compares by equality; keying on e.g. their
+ids would not be safe, since a freed tuple's address can be reused by a
+later registration and alias the signature.
+"""
 
 def get_registered_progress_bars() -> set[ProgressBar]:
     """Retrieve all ProgressBar objects registered globally in Dask.
 
+    `ProgressBar.active` only changes when a callback is registered or
+    unregistered, so the result is cached between calls and only recomputed
+    when the set of registered callbacks has changed. This makes repeated
+    polling cheap.
+
     Returns
     -------
     set[ProgressBar]
         The set of registered Dask progress bar objects.
     """
-    pb_set: set[ProgressBar] = set()
-    for _callback_tuple in ProgressBar.active:
-        _callback_func: Callable|None = _callback_tuple[0]
-        if (
-                isinstance(_callback_func, BoundMethod)
-                and isinstance(_callback_func.__self__, ProgressBar)
-        ):
-            pb_set.add(_callback_func.__self__)
+    global _registered_pbs_cache
+    signature: frozenset[tuple] = frozenset(ProgressBar.active)
+    if (
+            _registered_pbs_cache is not None
+            and _registered_pbs_cache[0] == signature
+    ):
+        return set(_registered_pbs_cache[1])
+    # Probe for the bound-method __self__ attribute directly. This is much
+    # cheaper than an isinstance check against a runtime_checkable Protocol,
+    # which goes through _ProtocolMeta.__instancecheck__ on every call. The
+    # set comprehension additionally avoids a bound-method lookup of
+    # `set.add` per iteration.
+    pb_set: set[ProgressBar] = {
+        _owner for _callback_tuple in ProgressBar.active
+        if isinstance(
+            _owner := getattr(_callback_tuple[0], '__self__', None),
+            ProgressBar,
+        )
+    }
+    _registered_pbs_cache = (signature, frozenset(pb_set))
     return pb_set
 ###END def get_registered_progress_bars
 
@@ -57,28 +77,29 @@ class _UniqueProgressBar(ProgressBar):
         if that is the case.
     """
 
-    @dataclasses.dataclass(frozen=True, kw_only=True)
-    class InitParams:
-        """Dataclass for storing the initialization parameters of a
-        _UniqueProgressBar instance.
-
-        Defaults are set using the documented default values of
-        `dask.diagnostics.progress.ProgressBar` as of version 2026.1.1.
-        """
-        minimum: int = 0
-        width: int = 40
-        dt: float = 0.1
-        out: TextIOBase | None = None
-    ###END class _UniqueProgressBar.InitParams
+    type InitParamsKey = tuple[int, int, float, TextIOBase | None]
+    """Cache key for a _UniqueProgressBar instance: a plain tuple of the
+    initialization parameters `(minimum, width, dt, out)`. A tuple is used
+    rather than e.g. a frozen dataclass because tuple hashing is a single
+    C-level call, with no generated `__hash__` bytecode or per-field getattr
+    calls.
+    """
 
-    _instances: dict[_UniqueProgressBar.InitParams, _UniqueProgressBar] = {}
+    # The annotation must be quoted: class-body annotations are evaluated
+    # eagerly on Python 3.13, where neither the class name nor the alias is
+    # defined yet at this point.
+    _instances: 'dict[InitParamsKey, _UniqueProgressBar]' = {}
 
     @classmethod
     def clear_instances(cls):
         """Clear all stored _UniqueProgressBar instances."""
-        for _params, _instance in tuple(cls._instances.items()):
+        # Swap in a fresh dict in one step rather than deleting keys one by
+        # one, and unregister the old instances afterwards so the stored
+        # state is never mutated mid-iteration.
+        _instances: dict[_UniqueProgressBar.InitParamsKey, _UniqueProgressBar]
+        _instances, cls._instances = cls._instances, {}
+        for _instance in _instances.values():
             _instance.unregister()
-            del cls._instances[_params]
     ###END def clear_instances
 
     @classmethod
@@ -109,12 +130,9 @@ class _UniqueProgressBar(ProgressBar):
             dt: float = 0.1,
             out: TextIOBase | None = None,
     ) -> ProgressBar:
-        init_params = _UniqueProgressBar.InitParams(
-            minimum=minimum,
-            width=width,
-            dt=dt,
-            out=out,
-        )
+        # Default parameter values are the documented defaults of
+        # `dask.diagnostics.progress.ProgressBar` as of version 2026.1.1.
+        init_params: _UniqueProgressBar.InitParamsKey = (minimum, width, dt, out)
         if init_params in cls._instances:
             return cls._instances[init_params]
         # Remove all existing instances
@@ -131,6 +149,13 @@ class _UniqueProgressBar(ProgressBar):
             dt: float = 0.1,
             out: TextIOBase | None = None,
     ):
+        # When __new__ returned a cached instance, __init__ still gets called
+        # again with the same parameters. Skip re-initialization in that
+        # case: calling self.register() again would append a duplicate
+        # callback to `Callback.active`, making the same bar fire twice on
+        # every Dask event.
+        if getattr(self, '_initialized', False):
+            return
         super().__init__(
             minimum=minimum,
             width=width,
@@ -138,6 +163,7 @@ class _UniqueProgressBar(ProgressBar):
             out=out,
         )
         self.register()
+        self._initialized = True
     ###END def __init__
 
 ###END class _UniqueProgressBar
@@ -1,14 +1,24 @@
 """Unit tests for the DataObject class."""
 
+import copy
 import typing as tp
 import pytest
-from hypothesis import given, strategies as st
+from hypothesis import HealthCheck, given, settings, strategies as st
 
 from korsbakken_python_utils.containers.dataobject import (
     DataObject,
+    SlottedDataObject,
     UniformTypeDataObject,
+    _reserved_attribute_names,
 )
 
+_RESERVED_NAMES: frozenset[str] = _reserved_attribute_names(DataObject)
+"""Attribute names that DataObject rejects because they are data descriptors
+on the type (e.g. '__dict__', '__class__'). Excluded from the hypothesis
+strategies below; the rejection itself is covered by
+test_reserved_names_rejected.
+"""
+
 
 class TestDataObject:
     """Test suite for the DataObject class."""
@@ -92,7 +102,17 @@ class TestDataObject:
         assert ('b', 2) in tuples
         assert len(tuples) == 2
 
-    @given(st.dictionaries(st.text(min_size=1).filter(lambda x: x.isidentifier()), st.integers()))
+    # The differing_executors health check is suppressed because this test is
+    # deliberately inherited and re-run by the subclass test suites below
+    # (one executor per test class), which is exactly the situation the
+    # health check flags.
+    @settings(suppress_health_check=[HealthCheck.differing_executors])
+    @given(st.dictionaries(
+        st.text(min_size=1).filter(
+            lambda x: x.isidentifier() and x not in _RESERVED_NAMES
+        ),
+        st.integers(),
+    ))
     def test_hypothesis_properties(self, data: dict[str, int]) -> None:
         """Property-based test using hypothesis to verify consistency.
 
@@ -127,6 +147,104 @@ class TestDataObject:
         with pytest.raises(KeyError):
             _ = obj['missing_key']
 
+    def test_from_mapping(self) -> None:
+        """Test construction from a mapping without kwargs expansion."""
+        data: dict[str, int] = {'a': 1, 'b': 2}
+        obj: DataObject = self.TestClass.from_mapping(data)
+        assert isinstance(obj, self.TestClass)
+        assert obj.to_dict() == data
+        # The instance must not share storage with the input mapping
+        data['a'] = 10
+        assert obj.a == 1
+
+    def test_from_records(self) -> None:
+        """Test batch construction from an iterable of mappings."""
+        records: list[dict[str, int]] = [{'a': 1}, {'a': 2, 'b': 3}, {}]
+        objs: list[DataObject] = self.TestClass.from_records(iter(records))
+        assert len(objs) == len(records)
+        for _obj, _record in zip(objs, records):
+            assert isinstance(_obj, self.TestClass)
+            assert _obj.to_dict() == _record
+
+    def test_reserved_names_rejected(self) -> None:
+        """Test that names shadowed by data descriptors on the type (like
+        '__dict__') are rejected by all paths that write to the instance
+        dict, instead of silently desynchronizing item and attribute
+        access."""
+        obj: DataObject = self.TestClass(a=1)
+        with pytest.raises(TypeError):
+            obj['__dict__'] = {}
+        with pytest.raises(TypeError):
+            obj['__class__'] = int
+        with pytest.raises(TypeError):
+            _ = self.TestClass(**{'__dict__': 0})
+        with pytest.raises(TypeError):
+            _ = self.TestClass.from_mapping({'__dict__': 0})
+        with pytest.raises(TypeError):
+            obj.update({'__class__': int})
+        with pytest.raises(TypeError):
+            obj.update(__dict__=0)
+        with pytest.raises(TypeError):
+            obj.setdefault('__dict__', 1)
+        assert obj.to_dict() == {'a': 1}
+
+    def test_freeze_caches_repr(self) -> None:
+        """Test that freeze caches and reuses the string representations."""
+        obj: DataObject = self.TestClass(a=1, b='two')
+        repr_before: str = repr(obj)
+        str_before: str = str(obj)
+        assert obj.freeze() is obj
+        assert repr(obj) == repr_before
+        assert str(obj) == str_before
+        # The cached string object should be returned as-is on every call
+        assert repr(obj) is repr(obj)
+
+    def test_freeze_blocks_mutation(self) -> None:
+        """Test that a frozen object rejects all mutation."""
+        obj: DataObject = self.TestClass(a=1)
+        obj.freeze()
+        with pytest.raises(TypeError):
+            obj.b = 2
+        with pytest.raises(TypeError):
+            obj['b'] = 2
+        with pytest.raises(TypeError):
+            del obj['a']
+        with pytest.raises(TypeError):
+            obj.update(b=2)
+        with pytest.raises(TypeError):
+            obj.pop('a')
+        with pytest.raises(TypeError):
+            obj.clear()
+        assert obj.to_dict() == {'a': 1}
+
+    def test_freeze_preserves_class_identity(self) -> None:
+        """Test that a frozen object still reads like the original class."""
+        obj: DataObject = self.TestClass(a=1)
+        obj.freeze()
+        assert isinstance(obj, self.TestClass)
+        assert type(obj).__name__ == self.TestClass.__name__
+        assert obj.a == 1
+        assert obj['a'] == 1
+
+    def test_freeze_copy_has_working_repr(self) -> None:
+        """Test that copies of a frozen object can still be repr'd."""
+        obj: DataObject = self.TestClass(a=1, b='two').freeze()
+        shallow: DataObject = copy.copy(obj)
+        deep: DataObject = copy.deepcopy(obj)
+        assert repr(shallow) == repr(obj)
+        assert str(shallow) == str(obj)
+        assert repr(deep) == repr(obj)
+        # Copies stay frozen
+        with pytest.raises(TypeError):
+            shallow.c = 3
+
+    def test_freeze_idempotent(self) -> None:
+        """Test that freezing an already frozen object is a no-op."""
+        obj: DataObject = self.TestClass(a=1)
+        frozen_type: type = type(obj.freeze())
+        assert obj.freeze() is obj
+        assert type(obj) is frozen_type
+
     def test_overwrite_attributes(self) -> None:
         """Test overwriting existing attributes."""
         obj: DataObject = self.TestClass(a=1)
@@ -140,3 +258,95 @@ class TestUniformTypeDataObject(TestDataObject):
     """Test suite for the UniformTypeDataObject class."""
 
     TestClass = UniformTypeDataObject
+
+
+class TestSlottedDataObject:
+    """Test suite for SlottedDataObject and DataObject.with_fields."""
+
+    Point: type[SlottedDataObject] = DataObject.with_fields(
+        'x', 'y', class_name='Point'
+    )
+
+    def test_with_fields_creates_subclass(self) -> None:
+        """Test that with_fields returns a SlottedDataObject subclass."""
+        assert issubclass(self.Point, SlottedDataObject)
+        assert self.Point.__name__ == 'Point'
+        assert self.Point.__slots__ == ('x', 'y')
+
+    def test_with_fields_rejects_shadowing_names(self) -> None:
+        """Test that field names colliding with SlottedDataObject attributes
+        are rejected."""
+        for _bad_name in ('items', 'keys', 'get', 'to_dict', '__repr__'):
+            with pytest.raises(ValueError):
+                DataObject.with_fields(_bad_name)
+        # Valid and invalid names mixed should still be rejected
+        with pytest.raises(ValueError):
+            DataObject.with_fields('x', 'update')
+
+    def test_no_instance_dict(self) -> None:
+        """Test that instances do not carry a per-instance __dict__."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        assert not hasattr(p, '__dict__')
+
+    def test_init_and_access(self) -> None:
+        """Test initialization and attribute/item access."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        assert p.x == 1
+        assert p['y'] == 2
+        assert len(p) == 2
+
+    def test_partial_init(self) -> None:
+        """Test that unset fields are excluded from iteration and len."""
+        p: SlottedDataObject = self.Point(x=1)
+        assert list(p) == ['x']
+        assert len(p) == 1
+        assert 'y' not in p
+        p.y = 2
+        assert len(p) == 2
+
+    def test_setitem_getitem(self) -> None:
+        """Test dictionary-style setting and getting of items."""
+        p: SlottedDataObject = self.Point()
+        p['x'] = 10
+        assert p['x'] == 10
+        assert p.x == 10
+
+    def test_delitem(self) -> None:
+        """Test deletion of items."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        del p['x']
+        assert 'x' not in p
+        with pytest.raises(AttributeError):
+            _ = p.x
+
+    def test_missing_key_raises_keyerror(self) -> None:
+        """Test that dictionary-style access to missing keys raises
+        KeyError."""
+        p: SlottedDataObject = self.Point(x=1)
+        with pytest.raises(KeyError):
+            _ = p['y']
+        with pytest.raises(KeyError):
+            _ = p['not_a_field']
+
+    def test_unknown_field_rejected(self) -> None:
+        """Test that names outside __slots__ cannot be set."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        with pytest.raises(AttributeError):
+            p.z = 3
+        with pytest.raises(KeyError):
+            p['z'] = 3
+        with pytest.raises(AttributeError):
+            _ = self.Point(x=1, z=3)
+
+    def test_str_repr(self) -> None:
+        """Test the string representations."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        assert str(p) == 'Point(x=1, y=2)'
+        assert 'x=1' in repr(p)
+        assert 'Point' in repr(p)
+
+    def test_to_dict_to_tuples(self) -> None:
+        """Test conversion to dict and to list of tuples."""
+        p: SlottedDataObject = self.Point(x=1, y=2)
+        assert p.to_dict() == {'x': 1, 'y': 2}
+        assert p.to_tuples() == [('x', 1), ('y', 2)]
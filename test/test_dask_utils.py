@@ -0,0 +1,84 @@
+"""Unit tests for the dask_utils module."""
+
+import pytest
+
+pytest.importorskip('dask')
+
+from dask.diagnostics.progress import ProgressBar
+
+from korsbakken_python_utils.dask_utils import (
+    _UniqueProgressBar,
+    get_registered_progress_bars,
+    set_global_progress_bar,
+)
+
+
+class TestDaskUtils:
+    """Test suite for the dask_utils module."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_progress_bars(self):
+        """Ensure no _UniqueProgressBar instances are registered before or
+        after each test."""
+        _UniqueProgressBar.clear_instances()
+        yield
+        _UniqueProgressBar.clear_instances()
+
+    def test_module_imports(self) -> None:
+        """Smoke test: the module must be importable and expose its public
+        functions (guards against e.g. eagerly evaluated annotations that
+        reference not-yet-defined names)."""
+        import korsbakken_python_utils.dask_utils  # noqa: F401
+        assert callable(get_registered_progress_bars)
+        assert callable(set_global_progress_bar)
+
+    def test_get_registered_progress_bars_empty(self) -> None:
+        """Test that no progress bars are reported when none are
+        registered."""
+        assert get_registered_progress_bars() == set()
+
+    def test_set_global_progress_bar_registers(self) -> None:
+        """Test that setting a global progress bar registers it."""
+        pb: ProgressBar = set_global_progress_bar()
+        assert isinstance(pb, ProgressBar)
+        assert pb in get_registered_progress_bars()
+
+    def test_same_parameters_reuse_instance(self) -> None:
+        """Test that repeated construction with the same parameters returns
+        the same instance without registering duplicate callbacks."""
+        pb: ProgressBar = set_global_progress_bar()
+        pb2: ProgressBar = set_global_progress_bar()
+        assert pb2 is pb
+        callbacks: list = [
+            _cb for _cb in ProgressBar.active
+            if getattr(_cb[0], '__self__', None) is pb
+        ]
+        assert len(callbacks) == 1
+
+    def test_different_parameters_replace_instance(self) -> None:
+        """Test that changing parameters replaces the registered bar."""
+        pb: ProgressBar = set_global_progress_bar()
+        pb2: ProgressBar = set_global_progress_bar(width=50)
+        assert pb2 is not pb
+        registered: set[ProgressBar] = get_registered_progress_bars()
+        assert pb2 in registered
+        assert pb not in registered
+
+    def test_no_stale_cache_after_reregistration(self) -> None:
+        """Test that an unregister-then-register sequence is not served a
+        stale cached result."""
+        pb: ProgressBar = set_global_progress_bar()
+        assert get_registered_progress_bars() == {pb}
+        _UniqueProgressBar.clear_instances()
+        pb2: ProgressBar = set_global_progress_bar()
+        assert pb2 is not pb
+        assert get_registered_progress_bars() == {pb2}
+
+    def test_get_registered_progress_bars_tracks_changes(self) -> None:
+        """Test that the cached result is invalidated when the registered
+        callbacks change."""
+        assert get_registered_progress_bars() == set()
+        pb: ProgressBar = set_global_progress_bar()
+        assert get_registered_progress_bars() == {pb}
+        _UniqueProgressBar.clear_instances()
+        assert get_registered_progress_bars() == set()